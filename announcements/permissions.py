@@ -1,6 +1,6 @@
 # announcements/permissions.py
 from rest_framework import permissions
-from organizations.models import OrgMembership
+from organizations.permissions import get_org_membership
 
 
 class IsActiveOrgAdminOrOwner(permissions.BasePermission):
@@ -15,11 +15,5 @@ class IsActiveOrgAdminOrOwner(permissions.BasePermission):
         if not active_org:
             return False
 
-        try:
-            membership = OrgMembership.objects.get(
-                user=request.user,
-                organization=active_org
-            )
-            return membership.is_admin_or_owner()
-        except OrgMembership.DoesNotExist:
-            return False
\ No newline at end of file
+        membership = get_org_membership(request, active_org)
+        return membership is not None and membership.is_admin_or_owner()
\ No newline at end of file
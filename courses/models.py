@@ -207,6 +207,9 @@ class Course(models.Model):
 
     class Meta:
         ordering = ["title"]
+        indexes = [
+            models.Index(fields=['organization', 'status'], name='course_org_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.status})"
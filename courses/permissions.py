@@ -1,5 +1,6 @@
 from rest_framework import permissions
 from .models import Enrollment, Course, Lesson, Module
+from organizations.permissions import get_org_membership
 
 
 class IsEnrolled(permissions.BasePermission):
@@ -59,11 +60,12 @@ class IsTutorOrOrgAdmin(permissions.BasePermission):
 
             if active_org:
                 # Check if user has appropriate role in the active org
-                return user.memberships.filter(
-                    organization=active_org,
-                    role__in=['owner', 'admin', 'tutor'],  # Define allowed roles
-                    is_active=True
-                ).exists()
+                membership = get_org_membership(request, active_org)
+                return (
+                    membership is not None
+                    and membership.is_active
+                    and membership.role in ['owner', 'admin', 'tutor']  # Define allowed roles
+                )
             else:
                 # Check if user is a platform tutor
                 return getattr(user, 'is_tutor', False)
@@ -96,6 +96,9 @@ class Event(models.Model):
 
     class Meta:
         ordering = ["-start_time"]
+        indexes = [
+            models.Index(fields=['course', 'event_status', 'start_time'], name='event_course_status_start_idx'),
+        ]
         verbose_name = "Event"
         verbose_name_plural = "Events"
 
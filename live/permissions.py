@@ -1,5 +1,5 @@
 from rest_framework import permissions
-from organizations.models import OrgMembership
+from organizations.permissions import get_org_membership
 from .models import LiveClass, LiveLesson
 
 
@@ -20,11 +20,12 @@ class IsTutorOrOrgAdmin(permissions.BasePermission):
             user = request.user
 
             if active_org:
-                return user.memberships.filter(
-                    organization=active_org,
-                    role__in=['owner', 'admin', 'tutor'],
-                    is_active=True
-                ).exists()
+                membership = get_org_membership(request, active_org)
+                return (
+                    membership is not None
+                    and membership.is_active
+                    and membership.role in ['owner', 'admin', 'tutor']
+                )
             else:
                 return hasattr(user, 'creator_profile') and user.creator_profile is not None
 
@@ -55,9 +56,7 @@ class IsTutorOrOrgAdmin(permissions.BasePermission):
         if not active_org:
             return owner == user
 
-        membership = OrgMembership.objects.filter(
-            user=user, organization=active_org
-        ).first()
+        membership = get_org_membership(request, active_org)
 
         if not membership:
             return False
@@ -1,7 +1,28 @@
 from django.contrib import admin
-from django.utils.html import format_html
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import Prefetch
+from django.utils.html import escape, format_html
+from django.utils.safestring import mark_safe
 from .models import Order, OrderItem
 
+STATUS_DISPLAY = dict(Order.STATUS_CHOICES)
+PAYMENT_STATUS_DISPLAY = dict(Order.PAYMENT_STATUS_CHOICES)
+
+STATUS_COLORS = {"pending": "#f39c12", "paid": "#27ae60", "cancelled": "#c0392b", "refunded": "#2980b9"}
+PAYMENT_STATUS_COLORS = {"unpaid": "#e74c3c", "partially_paid": "#e67e22", "paid": "#27ae60"}
+
+STATUS_BADGE_TMPL = '<span style="color: white; background-color: %s; padding: 3px 8px; border-radius: 10px; font-weight: bold; font-size: 11px;">%s</span>'
+PAYMENT_STATUS_BADGE_TMPL = '<span style="color: %s; font-weight: bold;">%s</span>'
+
+STATUS_BADGES = {
+    key: mark_safe(STATUS_BADGE_TMPL % (STATUS_COLORS.get(key, "#333"), escape(label)))
+    for key, label in STATUS_DISPLAY.items()
+}
+PAYMENT_STATUS_BADGES = {
+    key: mark_safe(PAYMENT_STATUS_BADGE_TMPL % (PAYMENT_STATUS_COLORS.get(key, "#000"), escape(label)))
+    for key, label in PAYMENT_STATUS_DISPLAY.items()
+}
+
 class OrderItemInline(admin.TabularInline):
     model = OrderItem
     extra = 0
@@ -10,15 +31,14 @@ class OrderItemInline(admin.TabularInline):
     can_delete = False
 
     def item_type_display(self, obj):
-        if obj.book: return f"Book: {obj.book.title}"
-        if obj.course: return f"Course: {obj.course.title}"
-        if obj.event: return f"Event: {obj.event.title}"
-        if obj.organization: return f"Org: {obj.organization.name}"
-        return "Unknown"
+        return str(obj)
     item_type_display.short_description = "Item"
 
-    def subtotal(self, obj):
-        return f"{obj.price * obj.quantity:.2f}"
+class OrderChangeList(ChangeList):
+    """The changelist never shows notes; the change form still loads it."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).defer("notes")
 
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
@@ -58,21 +78,17 @@ class OrderAdmin(admin.ModelAdmin):
     )
 
     def status_badge(self, obj):
-        colors = {"pending": "#f39c12", "paid": "#27ae60", "cancelled": "#c0392b", "refunded": "#2980b9"}
-        return format_html(
-            '<span style="color: white; background-color: {}; padding: 3px 8px; border-radius: 10px; font-weight: bold; font-size: 11px;">{}</span>',
-            colors.get(obj.status, "#333"),
-            obj.get_status_display()
-        )
+        badge = STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = mark_safe(STATUS_BADGE_TMPL % ("#333", escape(obj.status)))
+        return badge
     status_badge.short_description = "Order Status"
 
     def payment_status_badge(self, obj):
-        colors = {"unpaid": "#e74c3c", "partially_paid": "#e67e22", "paid": "#27ae60"}
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            colors.get(obj.payment_status, "#000"),
-            obj.get_payment_status_display()
-        )
+        badge = PAYMENT_STATUS_BADGES.get(obj.payment_status)
+        if badge is None:
+            badge = mark_safe(PAYMENT_STATUS_BADGE_TMPL % ("#000", escape(obj.payment_status)))
+        return badge
     payment_status_badge.short_description = "Payment"
 
     def amount_paid_display(self, obj):
@@ -86,11 +102,19 @@ class OrderAdmin(admin.ModelAdmin):
     balance_display.short_description = "Balance"
 
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related("user").prefetch_related("items")
+        items_qs = OrderItem.objects.select_related("book", "course", "event", "organization")
+        return super().get_queryset(request).select_related("user").prefetch_related(
+            Prefetch("items", queryset=items_qs),
+            "payments"
+        )
+
+    def get_changelist(self, request, **kwargs):
+        return OrderChangeList
 
 @admin.register(OrderItem)
 class OrderItemAdmin(admin.ModelAdmin):
     list_display = ("order", "purchased_item", "price", "quantity", "created_at_display")
+    list_select_related = ("order", "order__user", "book", "course", "event", "organization")
     search_fields = ("order__order_number", "book__title", "course__title", "event__title", "organization__name")
     autocomplete_fields = ("order", "book", "course", "event", "organization")
     list_filter = ("order__status", "order__payment_status")
@@ -102,6 +126,4 @@ class OrderItemAdmin(admin.ModelAdmin):
     def created_at_display(self, obj):
         return obj.order.created_at
     created_at_display.short_description = "Order Date"
-
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related("order", "book", "course", "event", "organization")
\ No newline at end of file
+    created_at_display.admin_order_field = "order__created_at"
\ No newline at end of file
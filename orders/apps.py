@@ -4,6 +4,3 @@ from django.apps import AppConfig
 class OrdersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'orders'
-
-    def ready(self):
-        import orders.signals
@@ -1,15 +1,26 @@
-import uuid
+import secrets
+from decimal import Decimal
+from functools import lru_cache
+
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.db.models.lookups import Exact, LessThan
 
 from books.models import Book
 from courses.models import Course
 from events.models import Event
 from organizations.models import Organization
 from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.utils.html import strip_tags
-from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def _order_confirmation_template():
+    """Load and compile the confirmation template once per process."""
+    return get_template("emails/order_confirmed.html")
 
 
 class Order(models.Model):
@@ -49,13 +60,18 @@ class Order(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', 'payment_status']),
+            models.Index(fields=['user', '-created_at']),
+        ]
 
     def __str__(self):
         return f"Order {self.order_number} - {self.user}"
 
     def save(self, *args, **kwargs):
         if not self.order_number:
-            self.order_number = str(uuid.uuid4()).split("-")[0].upper()
+            self.order_number = secrets.token_hex(4).upper()
         super().save(*args, **kwargs)
 
     def send_confirmation_email(self):
@@ -68,10 +84,7 @@ class Order(models.Model):
             "items": self.items.all(),
         }
 
-        html_message = render_to_string(
-            "emails/order_confirmed.html",
-            context
-        )
+        html_message = _order_confirmation_template().render(context)
         plain_message = strip_tags(html_message)
 
         send_mail(
@@ -86,27 +99,43 @@ class Order(models.Model):
     @property
     def amount_paid(self):
         """Sum only successful Paystack (or other) payments."""
-        return sum(p.amount for p in self.payments.filter(status="successful"))
+        return sum(p.amount for p in self.payments.all() if p.status == "successful")
 
     def update_payment_status(self):
-        was_paid = self.status == "paid"
+        from payments.models import Payment
 
-        paid = self.amount_paid
+        was_paid = self.status == "paid"
 
-        if paid == 0:
-            self.payment_status = "unpaid"
-            self.status = "pending"
-        elif paid < self.total_amount:
-            self.payment_status = "partially_paid"
-            self.status = "pending"
-        else:
-            self.payment_status = "paid"
-            self.status = "paid"
+        amount = models.DecimalField(max_digits=12, decimal_places=2)
+        paid = Coalesce(
+            Subquery(
+                Payment.objects.filter(order=OuterRef("pk"), status="successful")
+                .values("order")
+                .annotate(total=Sum("amount"))
+                .values("total"),
+                output_field=amount,
+            ),
+            Value(Decimal("0")),
+            output_field=amount,
+        )
 
-        self.save(update_fields=["payment_status", "status"])
+        Order.objects.filter(pk=self.pk).update(
+            payment_status=Case(
+                When(Exact(paid, 0), then=Value("unpaid")),
+                When(LessThan(paid, F("total_amount")), then=Value("partially_paid")),
+                default=Value("paid"),
+            ),
+            status=Case(
+                When(Exact(paid, 0), then=Value("pending")),
+                When(LessThan(paid, F("total_amount")), then=Value("pending")),
+                default=Value("paid"),
+            ),
+        )
+        self.refresh_from_db(fields=["payment_status", "status"])
 
         if not was_paid and self.status == "paid":
-            self.send_confirmation_email()
+            from .tasks import send_order_confirmation_task
+            transaction.on_commit(lambda: send_order_confirmation_task.delay(self.pk))
 
 
 class OrderItem(models.Model):
@@ -144,30 +173,50 @@ class OrderItem(models.Model):
 
     price = models.DecimalField(max_digits=10, decimal_places=2)
     quantity = models.PositiveIntegerField(default=1)
+    subtotal = models.GeneratedField(
+        expression=F("price") * F("quantity"),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        db_persist=True
+    )
 
     class Meta:
         verbose_name = "Order Item"
         verbose_name_plural = "Order Items"
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    Q(book__isnull=True, course__isnull=True, event__isnull=True)
+                    | Q(book__isnull=True, course__isnull=True, organization__isnull=True)
+                    | Q(book__isnull=True, event__isnull=True, organization__isnull=True)
+                    | Q(course__isnull=True, event__isnull=True, organization__isnull=True)
+                ),
+                name="orderitem_at_most_one_link",
+            )
+        ]
+
+    LINKED_ITEM_LABELS = (
+        ("book_id", "book", "Book", "title"),
+        ("course_id", "course", "Course", "title"),
+        ("event_id", "event", "Event", "title"),
+        ("organization_id", "organization", "Membership", "name"),
+    )
 
     def __str__(self):
-        if self.book:
-            return f"Book: {self.book.title}"
-        elif self.course:
-            return f"Course: {self.course.title}"
-        elif self.event:
-            return f"Event: {self.event.title}"
-        elif self.organization:
-            return f"Membership: {self.organization.name}"
-        else:
-            return "Unknown Item"
+        for fk_id, relation, label, name_attr in self.LINKED_ITEM_LABELS:
+            if getattr(self, fk_id) is not None:
+                return f"{label}: {getattr(getattr(self, relation), name_attr)}"
+        return "Unknown Item"
 
     def clean(self):
-        """Ensure that exactly one purchasable item type is linked."""
-        linked_items = [self.course, self.event, self.organization, self.book]
-
-        linked_count = sum(1 for item in linked_items if item is not None)
-
-        if linked_count == 0:
+        """
+        Ensure a purchasable item is linked. Linking more than one is rejected
+        by the orderitem_at_most_one_link constraint; "none linked" cannot be a
+        DB constraint because the links are SET_NULL when products are deleted.
+        """
+        if (
+            self.book_id is None
+            and self.course_id is None
+            and self.event_id is None
+            and self.organization_id is None
+        ):
             raise ValueError("OrderItem must be linked to a book, course, event, or organization.")
-        if linked_count > 1:
-            raise ValueError("OrderItem cannot be linked to more than one item type.")
\ No newline at end of file
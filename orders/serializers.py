@@ -1,4 +1,5 @@
 from django.db import transaction
+from django.db.models import Count, F, Q
 from rest_framework import serializers
 
 from books.models import Book
@@ -93,25 +94,30 @@ class OrderSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         items_data = validated_data.pop("items", [])
 
-        with transaction.atomic():
-            order = Order.objects.create(**validated_data)
-
-            total = 0
-            for item_data in items_data:
-                event = item_data.get('event')
-                course = item_data.get('course')
-
-                if event:
-                    if event.is_full():
-                        raise serializers.ValidationError(
-                            f"Sorry, the event '{event.title}' is now full and cannot be purchased."
-                        )
+        event_ids = [item["event"].pk for item in items_data if item.get("event")]
+        if event_ids:
+            full_event = Event.objects.filter(
+                pk__in=event_ids,
+                max_attendees__isnull=False
+            ).annotate(
+                confirmed_count=Count(
+                    "registrations",
+                    filter=Q(registrations__status="registered"),
+                    distinct=True
+                )
+            ).filter(confirmed_count__gte=F("max_attendees")).only("title").first()
+
+            if full_event:
+                raise serializers.ValidationError(
+                    f"Sorry, the event '{full_event.title}' is now full and cannot be purchased."
+                )
+
+        total = sum(item["price"] * item.get("quantity", 1) for item in items_data)
 
-                item = OrderItem.objects.create(order=order, **item_data)
-
-                total += item.price * item.quantity
-
-            order.total_amount = total
-            order.save()
+        with transaction.atomic():
+            order = Order.objects.create(total_amount=total, **validated_data)
+            OrderItem.objects.bulk_create(
+                [OrderItem(order=order, **item_data) for item_data in items_data]
+            )
 
         return order
\ No newline at end of file
@@ -0,0 +1,17 @@
+from celery import shared_task
+from .models import Order
+
+
+@shared_task(bind=True, max_retries=3)
+def send_order_confirmation_task(self, order_id):
+    """
+    Background task to send the payment confirmation email.
+    Retries up to 3 times on failure.
+    """
+    try:
+        order = Order.objects.select_related("user").get(pk=order_id)
+        order.send_confirmation_email()
+    except Order.DoesNotExist:
+        return
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=60)
@@ -1,7 +1,8 @@
+from django.db.models import Prefetch
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from .models import Order
+from .models import Order, OrderItem
 from .serializers import OrderSerializer, PaymentSerializer
 
 
@@ -15,7 +16,11 @@ class OrderViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only the orders belonging to the logged-in user."""
-        return Order.objects.filter(user=self.request.user).order_by("-created_at")
+        items_qs = OrderItem.objects.select_related("course", "event", "book")
+        return Order.objects.filter(user=self.request.user).prefetch_related(
+            Prefetch("items", queryset=items_qs),
+            "payments"
+        )
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -41,13 +46,14 @@ class OrderViewSet(viewsets.ModelViewSet):
         serializer = PaymentSerializer(data=request.data, context={"request": request})
 
         if serializer.is_valid():
-            payment = serializer.save(order=order, user=request.user)
+            serializer.save(order=order, user=request.user)
             order.update_payment_status()
+            order = self.get_queryset().get(pk=order.pk)
 
             return Response({
                 "message": "Payment recorded successfully",
-                "payment": PaymentSerializer(payment).data,
-                "order": OrderSerializer(order, context={"request": request}).data
+                "payment": serializer.data,
+                "order": self.get_serializer(order).data
             }, status=status.HTTP_201_CREATED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
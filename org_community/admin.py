@@ -1,7 +1,15 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.utils.html import format_html
 from .models import OrgJoinRequest, AdvancedOrgInvitation, NegotiationLog
 
+class DeferredTextChangeList(ChangeList):
+    """Skips the admin's changelist_defer columns, which no list column shows."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        return qs.defer(*self.model_admin.changelist_defer)
+
 class NegotiationLogInline(admin.TabularInline):
     model = NegotiationLog
     extra = 0
@@ -105,12 +113,25 @@ class OrgJoinRequestAdmin(admin.ModelAdmin):
         return "-"
     commission_display.short_description = "Proposed Comm."
 
+    changelist_defer = ('message',)
+
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('user', 'organization')
 
+    def get_changelist(self, request, **kwargs):
+        return DeferredTextChangeList
+
 @admin.register(NegotiationLog)
 class NegotiationLogAdmin(admin.ModelAdmin):
     list_display = ('invitation', 'actor', 'action', 'created_at')
     list_filter = ('action', 'created_at')
     search_fields = ('invitation__email', 'actor__username', 'note')
-    autocomplete_fields = ('invitation', 'actor')
\ No newline at end of file
+    autocomplete_fields = ('invitation', 'actor')
+
+    changelist_defer = ('note',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('invitation__organization', 'actor')
+
+    def get_changelist(self, request, **kwargs):
+        return DeferredTextChangeList
\ No newline at end of file
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class OrgCommunityConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'org_community'
+
+    def ready(self):
+        import org_community.signals
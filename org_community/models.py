@@ -4,6 +4,8 @@ from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from organizations.models import Organization
 
+TERMINAL_STATUSES = frozenset(('accepted', 'rejected', 'revoked'))
+
 
 class OrgJoinRequest(models.Model):
     ROLE_CHOICES = [
@@ -35,13 +37,56 @@ class OrgJoinRequest(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ("user", "organization", "status")
         ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'organization'],
+                condition=models.Q(status='pending'),
+                name='uniq_pending_join_req'
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['organization', '-created_at'],
+                condition=models.Q(status='pending'),
+                name='ojr_pending_idx'
+            ),
+            models.Index(fields=['user', '-created_at']),
+        ]
 
     def __str__(self):
         return f"{self.user.username} -> {self.organization.name} ({self.status})"
 
 
+class AdvancedOrgInvitationQuerySet(models.QuerySet):
+    @staticmethod
+    def resolved_q(statuses=TERMINAL_STATUSES):
+        """
+        Governance, and teaching for tutor invites, have both reached one of
+        statuses; the teaching status of a governance-only invite is ignored.
+        """
+        statuses = sorted(statuses)
+        return models.Q(gov_status__in=statuses) & (
+            models.Q(is_tutor_invite=False) | models.Q(tutor_status__in=statuses)
+        )
+
+    def annotate_resolved(self):
+        return self.annotate(
+            fully_resolved=models.ExpressionWrapper(self.resolved_q(), output_field=models.BooleanField())
+        )
+
+    def unresolved(self, statuses=TERMINAL_STATUSES):
+        return self.exclude(self.resolved_q(statuses))
+
+
+class AdvancedOrgInvitationManager(models.Manager):
+    def get_queryset(self):
+        return AdvancedOrgInvitationQuerySet(self.model, using=self._db)
+
+    def annotate_resolved(self):
+        return self.get_queryset().annotate_resolved()
+
+
 class AdvancedOrgInvitation(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Pending'),
@@ -83,21 +128,23 @@ class AdvancedOrgInvitation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = AdvancedOrgInvitationManager()
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['email', 'organization']),
+            models.Index(fields=['organization', '-created_at']),
+        ]
 
     def __str__(self):
         return f"Invite for {self.email} to {self.organization.name}"
 
     @property
     def is_fully_resolved(self):
-        gov_done = self.gov_status in ['accepted', 'rejected', 'revoked']
-        tutor_done = (not self.is_tutor_invite) or (self.tutor_status in ['accepted', 'rejected', 'revoked'])
-
-        if self.gov_status == 'accepted' and self.is_tutor_invite:
-            return self.tutor_status in ['accepted', 'rejected', 'revoked']
-
-        return gov_done and tutor_done
+        if self.gov_status not in TERMINAL_STATUSES:
+            return False
+        return not self.is_tutor_invite or self.tutor_status in TERMINAL_STATUSES
 
 
 class NegotiationLog(models.Model):
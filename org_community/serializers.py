@@ -1,10 +1,9 @@
 from rest_framework import serializers
-from django.contrib.auth import get_user_model
+from django.db.models import Count, Q, Value
 from .models import AdvancedOrgInvitation, NegotiationLog, OrgJoinRequest
 from organizations.models import Organization, OrgMembership
 from organizations.serializers import OrgUserSerializer, OrganizationSimpleSerializer
 
-User = get_user_model()
 
 class OrgDiscoverySerializer(serializers.ModelSerializer):
     stats = serializers.SerializerMethodField()
@@ -12,26 +11,53 @@ class OrgDiscoverySerializer(serializers.ModelSerializer):
     has_pending_request = serializers.SerializerMethodField()
     logo = serializers.SerializerMethodField()
 
+    # Organization columns read by to_representation; querysets feeding this
+    # serializer load only these.
+    model_columns = ('id', 'name', 'slug', 'description', 'logo', 'branding')
+
     class Meta:
         model = Organization
         fields = ('id', 'name', 'slug', 'description', 'logo', 'branding', 'stats', 'is_member', 'has_pending_request')
 
+    def to_representation(self, instance):
+        """
+        Read-only fast path: plain attribute reads for the model columns and
+        direct method-field calls, instead of DRF's per-field dispatch on every
+        row. Keep in sync with Meta.fields.
+        """
+        return {
+            'id': instance.id,
+            'name': instance.name,
+            'slug': instance.slug,
+            'description': instance.description,
+            'logo': self.get_logo(instance),
+            'branding': instance.branding,
+            'stats': self.get_stats(instance),
+            'is_member': self.get_is_member(instance),
+            'has_pending_request': self.get_has_pending_request(instance),
+        }
+
     def get_logo(self, obj):
-        if obj.logo:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.logo.url)
-            return obj.logo.url
-        return None
+        if not obj.logo:
+            return None
+        url = obj.logo.url
+        base_uri = self.context.get('base_uri')
+        if base_uri is not None:
+            # Storage backends may already return absolute (CDN) URLs.
+            return base_uri + url if url.startswith('/') and not url.startswith('//') else url
+        request = self.context.get('request')
+        if request:
+            return request.build_absolute_uri(url)
+        return url
 
     def get_stats(self, obj):
-        staff_count = OrgMembership.objects.filter(
-            organization=obj,
-            role__in=['owner', 'admin', 'tutor'],
-            is_active=True
-        ).count()
-        students = OrgMembership.objects.filter(organization=obj, role='student', is_active=True).count()
-        return {"tutors": staff_count, "students": students}
+        if hasattr(obj, 'tutor_count'):
+            return {"tutors": obj.tutor_count, "students": obj.student_count}
+
+        return OrgMembership.objects.filter(organization=obj, is_active=True).aggregate(
+            tutors=Count('id', filter=Q(role__in=['owner', 'admin', 'tutor'])),
+            students=Count('id', filter=Q(role='student'))
+        )
 
     def _get_user(self):
         request = self.context.get('request')
@@ -40,25 +66,31 @@ class OrgDiscoverySerializer(serializers.ModelSerializer):
         return None
 
     def get_is_member(self, obj):
+        member_org_ids = self.context.get('member_org_ids')
+        if member_org_ids is not None:
+            return obj.id in member_org_ids
+
         user = self._get_user()
         if not user or not user.is_authenticated:
             return False
         return OrgMembership.objects.filter(organization=obj, user=user, is_active=True).exists()
 
     def get_has_pending_request(self, obj):
+        pending_request_org_ids = self.context.get('pending_request_org_ids')
+        if pending_request_org_ids is not None:
+            return obj.id in pending_request_org_ids or obj.id in self.context['pending_invite_org_ids']
+
         user = self._get_user()
         if not user or not user.is_authenticated:
             return False
 
-        has_request = OrgJoinRequest.objects.filter(organization=obj, user=user, status='pending').exists()
-        if has_request:
-            return True
-
-        has_invitation = AdvancedOrgInvitation.objects.filter(organization=obj, email=user.email).exclude(
-            gov_status__in=['accepted', 'rejected', 'revoked'],
-            tutor_status__in=['accepted', 'rejected', 'revoked']
-        ).exists()
-        return has_invitation
+        pending_request = OrgJoinRequest.objects.filter(
+            organization=obj, user=user, status='pending'
+        ).values('organization_id')
+        pending_invitation = AdvancedOrgInvitation.objects.filter(
+            organization=obj, email=user.email
+        ).unresolved().values('organization_id')
+        return pending_request.union(pending_invitation).exists()
 
 
 class OrgJoinRequestCreateSerializer(serializers.ModelSerializer):
@@ -77,10 +109,19 @@ class OrgJoinRequestCreateSerializer(serializers.ModelSerializer):
         role = attrs.get('desired_role', 'tutor')
         commission = attrs.get('proposed_commission', 0)
 
-        if OrgMembership.objects.filter(user=user, organization=org).exists():
+        existing = set(
+            OrgMembership.objects.filter(user=user, organization=org)
+            .annotate(kind=Value('member')).values_list('kind', flat=True).order_by()
+            .union(
+                OrgJoinRequest.objects.filter(user=user, organization=org, status='pending')
+                .annotate(kind=Value('request')).values_list('kind', flat=True).order_by()
+            )
+        )
+
+        if 'member' in existing:
             raise serializers.ValidationError("You are already a member of this organization.")
 
-        if OrgJoinRequest.objects.filter(user=user, organization=org, status='pending').exists():
+        if 'request' in existing:
             raise serializers.ValidationError("You already have a pending request for this organization.")
 
         if role in ['tutor', 'admin']:
@@ -117,6 +158,10 @@ class InviteActionSerializer(serializers.Serializer):
         return data
 
 
+class BulkJoinRequestIdsSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+
 class NegotiationLogSerializer(serializers.ModelSerializer):
     actor_name = serializers.ReadOnlyField(source='actor.username')
 
@@ -129,6 +174,7 @@ class AdvancedInvitationSerializer(serializers.ModelSerializer):
     invited_by_name = serializers.ReadOnlyField(source='invited_by.username')
     logs = NegotiationLogSerializer(many=True, read_only=True)
     organization = OrganizationSimpleSerializer(read_only=True)
+    is_fully_resolved = serializers.SerializerMethodField()
 
     class Meta:
         model = AdvancedOrgInvitation
@@ -140,6 +186,17 @@ class AdvancedInvitationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'invited_by', 'organization', 'logs']
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        include_logs = getattr(self.context.get('view'), 'include_logs', None)
+        if include_logs is not None and not include_logs():
+            self.fields.pop('logs')
+
+    def get_is_fully_resolved(self, obj):
+        if hasattr(obj, 'fully_resolved'):
+            return obj.fully_resolved
+        return obj.is_fully_resolved
+
     def create(self, validated_data):
         if validated_data.get('is_tutor_invite'):
             comm = validated_data.get('tutor_commission', 0)
@@ -0,0 +1,34 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from organizations.models import Organization, OrgMembership
+from .models import OrgJoinRequest, AdvancedOrgInvitation
+from .utils import invalidate_discovery_cache, invalidate_org_discovery_cache
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def invalidate_org_discovery(sender, instance, **kwargs):
+    """Name, logo, branding or approval changes show up on every discovery page."""
+    invalidate_org_discovery_cache()
+
+
+@receiver(post_save, sender=OrgMembership)
+@receiver(post_delete, sender=OrgMembership)
+@receiver(post_save, sender=OrgJoinRequest)
+@receiver(post_delete, sender=OrgJoinRequest)
+def invalidate_member_discovery(sender, instance, **kwargs):
+    """
+    Membership and join request changes alter the user's is_member /
+    has_pending_request flags on the discovery list.
+    """
+    invalidate_discovery_cache(instance.user_id)
+
+
+@receiver(post_save, sender=AdvancedOrgInvitation)
+@receiver(post_delete, sender=AdvancedOrgInvitation)
+def invalidate_invitee_discovery(sender, instance, **kwargs):
+    for user_id in User.objects.filter(email=instance.email).values_list('id', flat=True):
+        invalidate_discovery_cache(user_id)
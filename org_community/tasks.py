@@ -0,0 +1,80 @@
+from celery import shared_task
+from .models import OrgJoinRequest, AdvancedOrgInvitation
+from .utils import (
+    deliver_community_email,
+    notify_admins_of_request,
+    notify_request_approved,
+    notify_rejection,
+    notify_tutor_of_invitation,
+    notify_counter_offer,
+    notify_invitation_accepted
+)
+
+
+@shared_task(autoretry_for=(Exception,), max_retries=3, retry_backoff=True)
+def send_community_email_task(subject, template_name, context, recipient):
+    """
+    Background task to render and send a community notification email to a
+    single recipient, so a retry never re-sends to addresses that already
+    received it. Retries up to 3 times with exponential backoff on failure.
+    """
+    deliver_community_email(subject, template_name, context, [recipient])
+
+
+def _get_join_request(join_request_id):
+    return OrgJoinRequest.objects.select_related('user', 'organization').filter(pk=join_request_id).first()
+
+
+def _get_invitation(invitation_id):
+    return AdvancedOrgInvitation.objects.select_related(
+        'organization__owner', 'invited_by'
+    ).filter(pk=invitation_id).first()
+
+
+@shared_task
+def notify_admins_of_request_task(join_request_id):
+    join_request = _get_join_request(join_request_id)
+    if join_request:
+        notify_admins_of_request(join_request)
+
+
+@shared_task
+def notify_request_approved_task(join_request_id):
+    join_request = _get_join_request(join_request_id)
+    if join_request:
+        notify_request_approved(join_request)
+
+
+@shared_task
+def notify_request_rejected_task(join_request_id, actor_name):
+    join_request = _get_join_request(join_request_id)
+    if join_request:
+        notify_rejection(join_request, actor_name, is_invitation=False)
+
+
+@shared_task
+def notify_tutor_of_invitation_task(invitation_id, tutor_username):
+    invitation = _get_invitation(invitation_id)
+    if invitation:
+        notify_tutor_of_invitation(invitation, tutor_username)
+
+
+@shared_task
+def notify_invitation_rejected_task(invitation_id, actor_name):
+    invitation = _get_invitation(invitation_id)
+    if invitation:
+        notify_rejection(invitation, actor_name, is_invitation=True)
+
+
+@shared_task
+def notify_counter_offer_task(invitation_id, actor_name):
+    invitation = _get_invitation(invitation_id)
+    if invitation:
+        notify_counter_offer(invitation, actor_name)
+
+
+@shared_task
+def notify_invitation_accepted_task(invitation_id, tutor_username):
+    invitation = _get_invitation(invitation_id)
+    if invitation:
+        notify_invitation_accepted(invitation, tutor_username)
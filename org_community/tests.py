@@ -1,3 +1,143 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from organizations.models import Organization, OrgMembership
+from organizations.models_finance import TutorAgreement
+from .models import AdvancedOrgInvitation, NegotiationLog, OrgJoinRequest
+from .tasks import notify_request_approved_task
+from .utils import get_user_org_state
+
+User = get_user_model()
+
+
+class InvitationRespondTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", email="owner@example.com", password="x")
+        self.tutor = User.objects.create_user(username="tutor", email="tutor@example.com", password="x")
+        self.org = Organization.objects.create(name="Acme", status="approved")
+        OrgMembership.objects.create(user=self.owner, organization=self.org, role="owner")
+        self.invite = AdvancedOrgInvitation.objects.create(
+            organization=self.org, email=self.tutor.email, invited_by=self.owner,
+            is_tutor_invite=True, tutor_commission=Decimal("45.00"),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.tutor)
+
+    def test_counter_offer_response_includes_new_log(self):
+        response = self.client.post(
+            f"/community/invitations/{self.invite.pk}/respond/",
+            {"section": "teaching", "action": "counter", "counter_value": "55.00", "note": "More please"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        log = NegotiationLog.objects.get(invitation=self.invite)
+        self.assertEqual([entry["id"] for entry in response.data["logs"]], [log.id])
+        self.assertEqual(response.data["logs"][0]["new_value"], "55.00")
+        self.assertEqual(response.data["tutor_status"], "negotiating")
+
+
+class JoinRequestBulkApproveTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", email="owner@example.com", password="x")
+        self.org = Organization.objects.create(name="Acme", status="approved")
+        OrgMembership.objects.create(user=self.owner, organization=self.org, role="owner")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+        self.url = "/community/requests/bulk_approve/"
+        self.headers = {"HTTP_X_ORGANIZATION_SLUG": self.org.slug}
+
+    def _request(self, username):
+        user = User.objects.create_user(username=username, email=f"{username}@example.com", password="x")
+        return OrgJoinRequest.objects.create(
+            user=user, organization=self.org, desired_role="tutor", proposed_commission=Decimal("50.00"),
+        )
+
+    def test_rejects_non_integer_ids(self):
+        response = self.client.post(self.url, {"ids": ["abc"]}, format="json", **self.headers)
+        self.assertEqual(response.status_code, 400)
+
+    def test_rejects_empty_ids(self):
+        response = self.client.post(self.url, {"ids": []}, format="json", **self.headers)
+        self.assertEqual(response.status_code, 400)
+
+    @mock.patch("org_community.views.notify_request_approved_task.delay")
+    @mock.patch("org_community.views.send_membership_welcome_task.delay")
+    def test_welcomes_only_created_memberships(self, welcome, notify):
+        fresh = self._request("fresh")
+        member = self._request("member")
+        existing = OrgMembership.objects.create(user=member.user, organization=self.org, role="tutor")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, {"ids": [fresh.pk, member.pk]}, format="json", **self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["approved"], [fresh.pk])
+        self.assertEqual(response.data["skipped"], [member.pk])
+        created = OrgMembership.objects.get(user=fresh.user, organization=self.org)
+        welcome.assert_called_once_with(created.pk)
+        self.assertNotEqual(created.pk, existing.pk)
+        notify.assert_called_once_with(fresh.pk)
+
+    @mock.patch("org_community.views.notify_request_approved_task.delay")
+    @mock.patch("org_community.views.send_membership_welcome_task.delay")
+    def test_reactivates_existing_agreement(self, welcome, notify):
+        returning = self._request("returning")
+        TutorAgreement.objects.create(
+            organization=self.org, user=returning.user, commission_percent=Decimal("45.00"), is_active=False,
+        )
+
+        response = self.client.post(self.url, {"ids": [returning.pk]}, format="json", **self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        agreement = TutorAgreement.objects.get(organization=self.org, user=returning.user)
+        self.assertTrue(agreement.is_active)
+        self.assertTrue(agreement.signed_by_user)
+        self.assertEqual(agreement.commission_percent, Decimal("50.00"))
+
+    def test_rejects_commission_below_minimum(self):
+        low = self._request("low")
+        OrgJoinRequest.objects.filter(pk=low.pk).update(proposed_commission=Decimal("10.00"))
+
+        response = self.client.post(self.url, {"ids": [low.pk]}, format="json", **self.headers)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["ids"], [low.pk])
+        self.assertFalse(OrgMembership.objects.filter(user=low.user, organization=self.org).exists())
+        self.assertFalse(TutorAgreement.objects.filter(user=low.user).exists())
+
+
+class NotificationTaskTests(TestCase):
+    @mock.patch("org_community.tasks.send_community_email_task.delay")
+    def test_worker_notification_sends_without_requeueing(self, requeue):
+        user = User.objects.create_user(username="applicant", email="applicant@example.com", password="x")
+        org = Organization.objects.create(name="Acme", status="approved")
+        join_request = OrgJoinRequest.objects.create(user=user, organization=org, desired_role="tutor")
+
+        notify_request_approved_task(join_request.pk)
+
+        requeue.assert_not_called()
+        self.assertEqual([message.to for message in mail.outbox], [["applicant@example.com"]])
+
+
+class DiscoveryCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="applicant", email="applicant@example.com", password="x")
+        self.org = Organization.objects.create(name="Acme", status="approved")
+
+    def test_user_state_invalidated_after_commit(self):
+        self.assertEqual(get_user_org_state(self.user)["member_org_ids"], set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            OrgMembership.objects.create(user=self.user, organization=self.org, role="tutor")
+            # Still the pre-commit state until the transaction commits.
+            self.assertEqual(get_user_org_state(self.user)["member_org_ids"], set())
 
-# Create your tests here.
+        self.assertEqual(get_user_org_state(self.user)["member_org_ids"], {self.org.pk})
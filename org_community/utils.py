@@ -1,21 +1,158 @@
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+import hashlib
+import re
+from functools import lru_cache
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.template.loader import get_template
 from django.conf import settings
 
+DISCOVERY_CACHE_TTL = 60
+USER_ORG_STATE_TTL = DISCOVERY_CACHE_TTL
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+# Bumped whenever an organization itself changes; part of every discovery key.
+_DISCOVERY_ORGS_VERSION_KEY = "orgdisc:version:orgs"
+
+
+def _discovery_version_key(user_id):
+    return f"orgdisc:version:{user_id}"
+
+
+def _user_org_state_key(user_id):
+    return f"orgdisc:state:{user_id}"
+
+
+def get_user_org_state(user):
+    """
+    Org ids the user is an active member of, has a pending join request for,
+    or holds an open invitation from. Cached per user; invalidated by the
+    org_community signals.
+    """
+    key = _user_org_state_key(user.pk)
+    state = cache.get(key)
+    if state is not None:
+        return state
+
+    from organizations.models import OrgMembership
+    from .models import OrgJoinRequest, AdvancedOrgInvitation
+
+    state = {
+        'member_org_ids': set(OrgMembership.objects.filter(
+            user=user, is_active=True
+        ).values_list('organization_id', flat=True)),
+        'pending_request_org_ids': set(OrgJoinRequest.objects.filter(
+            user=user, status='pending'
+        ).values_list('organization_id', flat=True)),
+        'pending_invite_org_ids': set(AdvancedOrgInvitation.objects.filter(
+            email=user.email
+        ).unresolved().values_list('organization_id', flat=True)),
+    }
+    cache.set(key, state, USER_ORG_STATE_TTL)
+    return state
+
+
+def discovery_cache_key(request):
+    user = request.user
+    user_id = user.pk if user.is_authenticated else "anon"
+    version_keys = [_DISCOVERY_ORGS_VERSION_KEY]
+    if user.is_authenticated:
+        version_keys.append(_discovery_version_key(user_id))
+    versions = cache.get_many(version_keys)
+    version = ".".join(str(versions.get(key, 0)) for key in version_keys)
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    raw = f"{user_id}:{version}:{request.get_host()}{request.path}?{query}"
+    return f"orgdisc:{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"
+
+
+def _bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def _invalidate_user_discovery(user_id):
+    cache.delete(_user_org_state_key(user_id))
+    _bump_version(_discovery_version_key(user_id))
+
+
+def invalidate_discovery_cache(user_id):
+    """
+    Runs once the surrounding transaction commits; invalidating earlier lets a
+    concurrent discovery request re-cache the pre-commit rows.
+    """
+    transaction.on_commit(lambda: _invalidate_user_discovery(user_id))
+
+
+def invalidate_org_discovery_cache():
+    """Drop every cached discovery page, anonymous ones included, on commit."""
+    transaction.on_commit(lambda: _bump_version(_DISCOVERY_ORGS_VERSION_KEY))
+
+
+@lru_cache(maxsize=None)
+def _email_template(template_name):
+    return get_template(f'emails/{template_name}.html')
+
 
 def send_community_email(subject, template_name, context, recipient_list):
-    html_content = render_to_string(f'emails/{template_name}.html', context)
-    text_content = strip_tags(html_content)
-
-    email = EmailMultiAlternatives(
-        subject,
-        text_content,
-        settings.DEFAULT_FROM_EMAIL,
-        recipient_list
+    """
+    Queue the email on the Celery worker so the request thread never waits
+    on SMTP. Context values must be JSON-serializable. Code already running
+    on the worker (the notify_* helpers) calls deliver_community_email().
+    """
+    from .tasks import send_community_email_task
+
+    for recipient in recipient_list:
+        send_community_email_task.delay(subject, template_name, context, recipient)
+
+
+def deliver_community_email(subject, template_name, context, recipient_list, connection=None):
+    """
+    Send one individually addressed message per recipient, so admins never
+    see each other's addresses, reusing a single SMTP connection for all.
+    """
+    html_content = _email_template(template_name).render(context)
+    text_content = _TAG_RE.sub('', html_content)
+
+    messages = []
+    for recipient in recipient_list:
+        email = EmailMultiAlternatives(
+            subject,
+            text_content,
+            settings.DEFAULT_FROM_EMAIL,
+            [recipient]
+        )
+        email.attach_alternative(html_content, "text/html")
+        messages.append(email)
+
+    connection = connection or get_connection()
+    connection.send_messages(messages)
+
+
+def get_admin_emails(organization):
+    return list(
+        organization.memberships.filter(
+            role__in=['admin', 'owner'],
+            is_active=True
+        ).exclude(user__email='').exclude(user__email__isnull=True).values_list('user__email', flat=True)
     )
-    email.attach_alternative(html_content, "text/html")
-    email.send()
+
+
+def get_owner_email(organization):
+    """
+    Uses the denormalized Organization.owner (select_related by callers) and
+    only falls back to the owner membership for rows not yet backfilled.
+    """
+    owner = organization.owner
+    if owner is None:
+        membership = organization.memberships.filter(role='owner').select_related('user').first()
+        owner = membership.user if membership else None
+    return owner.email if owner else None
 
 
 def notify_tutor_of_invitation(invitation, tutor_username):
@@ -23,10 +160,10 @@ def notify_tutor_of_invitation(invitation, tutor_username):
         'org_name': invitation.organization.name,
         'invited_by': invitation.invited_by.username,
         'role': invitation.gov_role,
-        'commission': invitation.tutor_commission if invitation.is_tutor_invite else None,
+        'commission': str(invitation.tutor_commission) if invitation.is_tutor_invite else None,
         'profile_url': f"https://tutors.e-vuka.com/tutor-profile/{tutor_username}"
     }
-    send_community_email(
+    deliver_community_email(
         f"Invitation to join {invitation.organization.name}",
         'tutor_invited',
         context,
@@ -35,12 +172,7 @@ def notify_tutor_of_invitation(invitation, tutor_username):
 
 
 def notify_admins_of_request(join_request):
-    admins = join_request.organization.memberships.filter(
-        role__in=['admin', 'owner'],
-        is_active=True
-    ).select_related('user')
-
-    recipient_emails = [m.user.email for m in admins if m.user.email]
+    recipient_emails = get_admin_emails(join_request.organization)
     if not recipient_emails:
         return
 
@@ -51,7 +183,7 @@ def notify_admins_of_request(join_request):
         'message': join_request.message,
         'manage_url': f"https://tutors.e-vuka.com/{join_request.organization.slug}"
     }
-    send_community_email(
+    deliver_community_email(
         f"New Join Request: {join_request.user.username}",
         'admin_new_request',
         context,
@@ -64,7 +196,7 @@ def notify_request_approved(join_request):
         'org_name': join_request.organization.name,
         'org_url': f"https://tutors.e-vuka.com/{join_request.organization.slug}"
     }
-    send_community_email(
+    deliver_community_email(
         f"Request Approved: Welcome to {join_request.organization.name}",
         'request_approved',
         context,
@@ -73,18 +205,17 @@ def notify_request_approved(join_request):
 
 
 def notify_counter_offer(invitation, actor_name):
-    admins = invitation.organization.memberships.filter(role__in=['admin', 'owner'], is_active=True)
-    recipient_emails = [m.user.email for m in admins if m.user.email]
+    recipient_emails = get_admin_emails(invitation.organization)
     if not recipient_emails:
         return
 
     context = {
         'org_name': invitation.organization.name,
         'actor_name': actor_name,
-        'new_commission': invitation.tutor_commission,
+        'new_commission': str(invitation.tutor_commission),
         'manage_url': f"https://tutors.e-vuka.com/{invitation.organization.slug}"
     }
-    send_community_email(
+    deliver_community_email(
         f"Counter Offer from {actor_name}",
         'invite_countered',
         context,
@@ -94,8 +225,8 @@ def notify_counter_offer(invitation, actor_name):
 
 def notify_rejection(instance, actor_name, is_invitation=True):
     if is_invitation:
-        owner = instance.organization.memberships.filter(role='owner').first()
-        recipients = [owner.user.email] if owner else []
+        owner_email = get_owner_email(instance.organization)
+        recipients = [owner_email] if owner_email else []
         subject = f"Invitation Declined: {actor_name}"
         template = 'invite_rejected_by_tutor'
         link = f"https://tutors.e-vuka.com/{instance.organization.slug}"
@@ -111,12 +242,12 @@ def notify_rejection(instance, actor_name, is_invitation=True):
             'actor_name': actor_name,
             'action_url': link
         }
-        send_community_email(subject, template, context, recipients)
+        deliver_community_email(subject, template, context, recipients)
 
 
 def notify_invitation_accepted(invitation, tutor_username):
-    owner = invitation.organization.memberships.filter(role='owner').first()
-    recipients = [owner.user.email] if owner else []
+    owner_email = get_owner_email(invitation.organization)
+    recipients = [owner_email] if owner_email else []
     if not recipients:
         return
 
@@ -125,7 +256,7 @@ def notify_invitation_accepted(invitation, tutor_username):
         'org_name': invitation.organization.name,
         'org_url': f"https://tutors.e-vuka.com/{invitation.organization.slug}"
     }
-    send_community_email(
+    deliver_community_email(
         f"{tutor_username} has joined {invitation.organization.name}",
         'invitation_accepted',
         context,
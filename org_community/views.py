@@ -1,16 +1,24 @@
 from rest_framework import viewsets, permissions, status, generics
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from django.db import transaction
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, DecimalField, Exists, OuterRef, Prefetch, Q, Value, When
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework.filters import SearchFilter
-from django.shortcuts import get_object_or_404
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.pagination import LimitOffsetPagination
+from django.http import Http404
+from django.utils import timezone
 
+from organizations.constants import MIN_TUTOR_SHARE_PERCENT
+from organizations.filters import OrganizationFilter
 from organizations.models import Organization, OrgMembership
 from organizations.models_finance import TutorAgreement
-from organizations.permissions import IsOrgAdminOrOwner, IsOrgStaff
+from organizations.permissions import IsOrgAdminOrOwner, get_active_org, get_org_membership
+from organizations.tasks import send_membership_welcome_task
 
 from .models import OrgJoinRequest, AdvancedOrgInvitation, NegotiationLog
 from .serializers import (
@@ -18,29 +26,85 @@ from .serializers import (
     OrgJoinRequestCreateSerializer,
     OrgJoinRequestSerializer,
     AdvancedInvitationSerializer,
-    InviteActionSerializer
+    InviteActionSerializer,
+    BulkJoinRequestIdsSerializer,
 )
 from .utils import (
-    notify_admins_of_request,
-    notify_request_approved,
-    notify_rejection,
-    notify_tutor_of_invitation,
-    notify_counter_offer,
-    notify_invitation_accepted
+    DISCOVERY_CACHE_TTL,
+    discovery_cache_key,
+    get_user_org_state,
+    invalidate_discovery_cache
+)
+from .tasks import (
+    notify_admins_of_request_task,
+    notify_request_approved_task,
+    notify_request_rejected_task,
+    notify_tutor_of_invitation_task,
+    notify_invitation_rejected_task,
+    notify_counter_offer_task,
+    notify_invitation_accepted_task
 )
 
 User = get_user_model()
 
+INVITE_SECTIONS = frozenset(('governance', 'teaching'))
+INVITE_ACTIONS = frozenset(('accept', 'reject', 'counter'))
+
+
+class DiscoveryPagination(LimitOffsetPagination):
+    """
+    Opt-in via ?limit= so existing clients keep the plain list response;
+    any requested page size is capped.
+    """
+    max_limit = 100
+
 
 class OrganizationDiscoveryViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [permissions.AllowAny]
     serializer_class = OrgDiscoverySerializer
-    queryset = Organization.objects.filter(approved=True)
-    filter_backends = [SearchFilter]
+    pagination_class = DiscoveryPagination
+    filter_backends = [DjangoFilterBackend, SearchFilter]
     search_fields = ['name', 'description']
+    filterset_class = OrganizationFilter
+
+    def get_queryset(self):
+        return Organization.objects.filter(approved=True).annotate(
+            tutor_count=Count(
+                'memberships',
+                filter=Q(memberships__role__in=['owner', 'admin', 'tutor'], memberships__is_active=True)
+            ),
+            student_count=Count(
+                'memberships',
+                filter=Q(memberships__role='student', memberships__is_active=True)
+            )
+        ).only(*self.serializer_class.model_columns)
 
     def get_serializer_context(self):
-        return {'request': self.request}
+        return {
+            'request': self.request,
+            'base_uri': f"{self.request.scheme}://{self.request.get_host()}",
+            **self.get_user_org_sets()
+        }
+
+    def list(self, request, *args, **kwargs):
+        cache_key = discovery_cache_key(request)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, DISCOVERY_CACHE_TTL)
+        return response
+
+    def get_user_org_sets(self):
+        user = self.request.user
+        if not user.is_authenticated:
+            return {
+                'member_org_ids': set(),
+                'pending_request_org_ids': set(),
+                'pending_invite_org_ids': set(),
+            }
+        return get_user_org_state(user)
 
 
 class RequestToJoinView(generics.CreateAPIView):
@@ -49,48 +113,133 @@ class RequestToJoinView(generics.CreateAPIView):
 
     def perform_create(self, serializer):
         instance = serializer.save(user=self.request.user)
-        transaction.on_commit(lambda: notify_admins_of_request(instance))
+        transaction.on_commit(lambda: notify_admins_of_request_task.delay(instance.pk))
+
 
+class ActiveOrgMixin:
+    """
+    Resolves the active organization and the user's role in it once per
+    request, sharing the lookups with the org permission classes; DRF calls
+    get_queryset() again from get_object() and the pagination/filter paths.
+    """
 
-class OrgJoinRequestViewSet(viewsets.ModelViewSet):
+    def get_active_org(self):
+        return get_active_org(self.request)
+
+    def get_active_org_role(self):
+        active_org = self.get_active_org()
+        if not active_org:
+            return None
+        membership = get_org_membership(self.request, active_org)
+        return membership.role if membership else None
+
+
+class OrgJoinRequestViewSet(ActiveOrgMixin, viewsets.ModelViewSet):
     serializer_class = OrgJoinRequestSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        active_org = getattr(self.request, "active_organization", None)
 
-        if not active_org:
-            slug = self.request.headers.get("X-Organization-Slug")
-            if slug:
-                active_org = Organization.objects.filter(slug=slug).first()
+        if self.action == 'cancel':
+            return self._with_related(OrgJoinRequest.objects.filter(user=user))
+
+        if self.action in ('approve', 'bulk_approve', 'reject'):
+            # IsOrgAdminOrOwner has already vetted the role in the active org.
+            return self._with_related(OrgJoinRequest.objects.filter(
+                organization=self.get_active_org(), status="pending"
+            ))
+
+        active_org = self.get_active_org()
 
         if active_org:
-            membership = OrgMembership.objects.filter(user=user, organization=active_org).first()
-            if membership and membership.role in ["admin", "owner"]:
-                return OrgJoinRequest.objects.filter(organization=active_org, status="pending").select_related('user')
+            if self.get_active_org_role() in ["admin", "owner"]:
+                return self._with_related(OrgJoinRequest.objects.filter(
+                    organization=active_org, status="pending"
+                ))
             return OrgJoinRequest.objects.none()
 
-        return OrgJoinRequest.objects.filter(user=user).select_related('organization')
+        return self._with_related(OrgJoinRequest.objects.filter(user=user))
+
+    def _with_related(self, queryset):
+        queryset = queryset.select_related('user', 'organization')
+        if self.action == 'list':
+            # Only what OrgJoinRequestSerializer renders.
+            queryset = queryset.only(
+                'id', 'message', 'status', 'desired_role', 'proposed_commission', 'created_at',
+                'user__id', 'user__username', 'user__email', 'user__first_name', 'user__last_name',
+                'organization__id', 'organization__name', 'organization__slug',
+                'organization__logo', 'organization__org_type', 'organization__status',
+            )
+        elif self.action in ('approve', 'bulk_approve', 'reject'):
+            # Decisions read the applicant's identity only (membership, invite
+            # cleanup by email, welcome email); the organization stays whole
+            # since OrgMembership.save() works with it.
+            queryset = queryset.only(
+                'id', 'user', 'organization', 'desired_role', 'proposed_commission', 'status',
+                'user__id', 'user__email', 'user__username',
+            )
+        return queryset
+
+    def _transition(self, req, new_status):
+        """
+        Move a pending request to new_status with a conditional UPDATE, so a
+        concurrent decision on the same request loses cleanly. Bypasses
+        post_save, hence the explicit discovery cache invalidation.
+        """
+        updated = OrgJoinRequest.objects.filter(pk=req.pk, status='pending').update(
+            status=new_status, updated_at=timezone.now()
+        )
+        if not updated:
+            return False
+        req.status = new_status
+        invalidate_discovery_cache(req.user_id)
+        return True
+
+    @staticmethod
+    def _sign_agreements(organization, commissions):
+        """
+        Bulk counterpart of InvitationViewSet._sign_agreement for a
+        {user_id: commission} map: insert the missing agreements, then update
+        every pair in place, which also covers existing (possibly inactive)
+        rows and any inserted concurrently.
+        """
+        agreements = TutorAgreement.objects.filter(organization=organization, user_id__in=commissions)
+        existing = set(agreements.values_list('user_id', flat=True))
+        TutorAgreement.objects.bulk_create([
+            TutorAgreement(
+                organization=organization,
+                user_id=user_id,
+                commission_percent=commission,
+                is_active=True,
+                signed_by_user=True
+            )
+            for user_id, commission in commissions.items() if user_id not in existing
+        ], ignore_conflicts=True, batch_size=500)
+        agreements.update(
+            commission_percent=Case(
+                *[When(user_id=user_id, then=Value(commission)) for user_id, commission in commissions.items()],
+                output_field=DecimalField(max_digits=5, decimal_places=2),
+            ),
+            is_active=True,
+            signed_by_user=True,
+            updated_at=timezone.now(),
+        )
 
     @action(detail=True, methods=['post'], permission_classes=[IsOrgAdminOrOwner])
     @transaction.atomic
     def approve(self, request, pk=None):
         req = self.get_object()
-        if req.status != 'pending':
+        if not self._transition(req, 'approved'):
             return Response({"error": "Request not pending."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if OrgMembership.objects.filter(user=req.user, organization=req.organization).exists():
-            req.status = 'approved'
-            req.save()
-            return Response({"error": "User is already a member."}, status=status.HTTP_400_BAD_REQUEST)
-
-        OrgMembership.objects.create(
+        _, created = OrgMembership.objects.get_or_create(
             user=req.user,
             organization=req.organization,
-            role=req.desired_role,
-            is_active=True
+            defaults={'role': req.desired_role, 'is_active': True}
         )
+        if not created:
+            return Response({"error": "User is already a member."}, status=status.HTTP_400_BAD_REQUEST)
 
         if req.desired_role == 'tutor':
             TutorAgreement.objects.create(
@@ -101,28 +250,101 @@ class OrgJoinRequestViewSet(viewsets.ModelViewSet):
                 signed_by_user=True
             )
 
-        req.status = 'approved'
-        req.save()
-
         AdvancedOrgInvitation.objects.filter(
             email=req.user.email,
             organization=req.organization
         ).delete()
 
-        transaction.on_commit(lambda: notify_request_approved(req))
+        transaction.on_commit(lambda: notify_request_approved_task.delay(req.pk))
 
         return Response({"status": f"Request approved. User added as {req.desired_role}."})
 
+    @action(detail=False, methods=['post'], permission_classes=[IsOrgAdminOrOwner])
+    @transaction.atomic
+    def bulk_approve(self, request):
+        """
+        Approve several pending requests of the active organization at once.
+        Memberships and agreements are inserted with bulk_create, so the work
+        OrgMembership.save() and its post_save receivers would do (welcome
+        email, discovery cache) is repeated here explicitly.
+        """
+        ids_serializer = BulkJoinRequestIdsSerializer(data=request.data)
+        if not ids_serializer.is_valid():
+            return Response({"error": "Provide a non-empty list of request ids."}, status=status.HTTP_400_BAD_REQUEST)
+
+        org = self.get_active_org()
+        reqs = list(self.get_queryset().filter(
+            pk__in=ids_serializer.validated_data['ids']
+        ).select_for_update(of=('self',)))
+
+        # bulk_create skips TutorAgreement.save() and its minimum share check.
+        below_minimum = [
+            r.pk for r in reqs
+            if r.desired_role == 'tutor' and r.proposed_commission < MIN_TUTOR_SHARE_PERCENT
+        ]
+        if below_minimum:
+            return Response(
+                {"error": f"Cannot approve. Commission below {MIN_TUTOR_SHARE_PERCENT:.0f}% limit.",
+                 "ids": below_minimum},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        existing = set(OrgMembership.objects.filter(
+            organization=org, user_id__in=[r.user_id for r in reqs]
+        ).values_list('user_id', flat=True))
+        to_approve = [r for r in reqs if r.user_id not in existing]
+        if not to_approve:
+            return Response({"approved": [], "skipped": [r.pk for r in reqs]})
+
+        # bulk_create(ignore_conflicts=True) does not report which rows were
+        # inserted; the shared date_joined tells this batch apart from a
+        # membership created concurrently by another path.
+        joined = timezone.now()
+        OrgMembership.objects.bulk_create([
+            OrgMembership(user=r.user, organization=org, role=r.desired_role, is_active=True, date_joined=joined)
+            for r in to_approve
+        ], ignore_conflicts=True, batch_size=500)
+        created = dict(OrgMembership.objects.filter(
+            organization=org, user_id__in=[r.user_id for r in to_approve], date_joined=joined
+        ).values_list('user_id', 'id'))
+        to_approve = [r for r in to_approve if r.user_id in created]
+        if not to_approve:
+            return Response({"approved": [], "skipped": [r.pk for r in reqs]})
+
+        tutor_commissions = {r.user_id: r.proposed_commission for r in to_approve if r.desired_role == 'tutor'}
+        if tutor_commissions:
+            self._sign_agreements(org, tutor_commissions)
+
+        approved_ids = [r.pk for r in to_approve]
+        OrgJoinRequest.objects.filter(pk__in=approved_ids).update(status='approved', updated_at=timezone.now())
+        AdvancedOrgInvitation.objects.filter(
+            organization=org, email__in={r.user.email for r in to_approve}
+        ).delete()
+
+        for r in to_approve:
+            invalidate_discovery_cache(r.user_id)
+        cache.delete(Organization.stats_cache_key(org.pk))
+
+        def after_commit():
+            for membership_id in created.values():
+                send_membership_welcome_task.delay(membership_id)
+            for pk in approved_ids:
+                notify_request_approved_task.delay(pk)
+
+        transaction.on_commit(after_commit)
+
+        return Response({
+            "approved": approved_ids,
+            "skipped": [r.pk for r in reqs if r.pk not in approved_ids],
+        })
+
     @action(detail=True, methods=['post'], permission_classes=[IsOrgAdminOrOwner])
     def reject(self, request, pk=None):
         req = self.get_object()
-        if req.status != 'pending':
+        if not self._transition(req, 'rejected'):
             return Response({"error": "Request not pending."}, status=status.HTTP_400_BAD_REQUEST)
 
-        req.status = 'rejected'
-        req.save()
-
-        transaction.on_commit(lambda: notify_rejection(req, request.user.username, is_invitation=False))
+        transaction.on_commit(lambda: notify_request_rejected_task.delay(req.pk, request.user.username))
 
         return Response({"status": "Request rejected."})
 
@@ -135,33 +357,57 @@ class OrgJoinRequestViewSet(viewsets.ModelViewSet):
         return Response({"status": "Request withdrawn."})
 
 
-class InvitationViewSet(viewsets.ModelViewSet):
+class InvitationViewSet(ActiveOrgMixin, viewsets.ModelViewSet):
     serializer_class = AdvancedInvitationSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
         user = self.request.user
-        active_org = getattr(self.request, "active_organization", None)
-
-        if not active_org:
-            slug = self.request.headers.get("X-Organization-Slug")
-            if slug:
-                active_org = Organization.objects.filter(slug=slug).first()
+        active_org = self.get_active_org()
 
         if active_org:
-            membership = OrgMembership.objects.filter(user=user, organization=active_org).first()
-            if membership and membership.role in ["admin", "owner"]:
-                return AdvancedOrgInvitation.objects.filter(organization=active_org)
+            if self.get_active_org_role() in ["admin", "owner"]:
+                return self._with_related(AdvancedOrgInvitation.objects.filter(organization=active_org))
             return AdvancedOrgInvitation.objects.none()
 
-        return AdvancedOrgInvitation.objects.filter(email=user.email)
+        return self._with_related(AdvancedOrgInvitation.objects.filter(email=user.email))
+
+    def include_logs(self):
+        """Negotiation logs are omitted from list output unless ?include=logs."""
+        if self.action != 'list':
+            return True
+        return 'logs' in self.request.query_params.get('include', '').split(',')
+
+    def _with_related(self, queryset):
+        queryset = queryset.select_related('organization', 'invited_by')
+        # Read-only actions only: respond may add a log before rendering, and a
+        # prefetch taken by get_object() would hide it from the response.
+        if self.action in ('list', 'retrieve') and self.include_logs():
+            queryset = queryset.prefetch_related(
+                Prefetch('logs', queryset=NegotiationLog.objects.select_related('actor').only(
+                    'id', 'invitation_id', 'actor_id', 'actor__username', 'action',
+                    'previous_value', 'new_value', 'note', 'created_at'
+                ).order_by('created_at'))
+            )
+        if self.action in ('list', 'retrieve'):
+            # The inviter and organization are only rendered as a username and
+            # OrganizationSimpleSerializer; skip the rest of both joined rows.
+            queryset = queryset.annotate_resolved().only(
+                'id', 'email', 'gov_role', 'gov_status', 'is_tutor_invite', 'tutor_commission',
+                'tutor_status', 'created_at', 'updated_at',
+                'invited_by__id', 'invited_by__username',
+                'organization__id', 'organization__name', 'organization__slug',
+                'organization__logo', 'organization__org_type', 'organization__status',
+            )
+        elif self.action == 'respond':
+            # Locked so concurrent responses to one invite apply in turn.
+            queryset = queryset.select_related('organization__owner').select_for_update(of=('self',))
+        return queryset
 
     def perform_create(self, serializer):
-        active_org = getattr(self.request, "active_organization", None)
-        if not active_org:
-            slug = self.request.headers.get("X-Organization-Slug")
-            if slug:
-                active_org = get_object_or_404(Organization, slug=slug)
+        active_org = self.get_active_org()
+        if not active_org and self.request.headers.get("X-Organization-Slug"):
+            raise Http404
 
         if not active_org:
             raise serializers.ValidationError({"detail": "Active organization context required."})
@@ -171,20 +417,24 @@ class InvitationViewSet(viewsets.ModelViewSet):
 
         invite_email = serializer.validated_data.get('email')
 
-        if OrgMembership.objects.filter(user__email=invite_email, organization=active_org).exists():
+        # User.email is not unique, so prefer a matching account that is
+        # already a member, then the lowest pk as .first() would.
+        target_user = User.objects.filter(email=invite_email).annotate(
+            is_member=Exists(OrgMembership.objects.filter(user=OuterRef('pk'), organization=active_org))
+        ).order_by('-is_member', 'pk').only('id', 'username').first()
+
+        if target_user and target_user.is_member:
             raise serializers.ValidationError({"email": "This user is already a member of the organization."})
 
-        if AdvancedOrgInvitation.objects.filter(email=invite_email, organization=active_org).exclude(
-                gov_status__in=['rejected', 'revoked'],
-                tutor_status__in=['rejected', 'revoked']
-        ).exists():
+        if AdvancedOrgInvitation.objects.filter(
+                email=invite_email, organization=active_org
+        ).unresolved(statuses=('rejected', 'revoked')).exists():
             raise serializers.ValidationError({"email": "A pending invitation already exists for this email."})
 
         instance = serializer.save(organization=active_org, invited_by=self.request.user)
 
-        target_user = User.objects.filter(email=instance.email).first()
         tutor_username = target_user.username if target_user else instance.email
-        transaction.on_commit(lambda: notify_tutor_of_invitation(instance, tutor_username))
+        transaction.on_commit(lambda: notify_tutor_of_invitation_task.delay(instance.pk, tutor_username))
 
     @action(detail=True, methods=['post'], permission_classes=[IsOrgAdminOrOwner])
     def revoke(self, request, pk=None):
@@ -192,79 +442,127 @@ class InvitationViewSet(viewsets.ModelViewSet):
         inv.delete()
         return Response({"status": "Invitation revoked."})
 
+    @action(detail=False, methods=['post'], permission_classes=[IsOrgAdminOrOwner])
+    def bulk_revoke(self, request):
+        """
+        Revoke several of the active organization's invitations with a single
+        DELETE; ids from other organizations are ignored.
+        """
+        ids = request.data.get('ids')
+        if not isinstance(ids, list) or not ids:
+            return Response({"error": "Provide a non-empty list of invitation ids."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            _, deleted = AdvancedOrgInvitation.objects.filter(
+                pk__in=ids, organization=self.get_active_org()
+            ).delete()
+        except DjangoValidationError:
+            return Response({"error": "Invalid invitation id."}, status=status.HTTP_400_BAD_REQUEST)
+        # The total from delete() also counts cascaded negotiation logs.
+        return Response({"revoked": deleted.get(AdvancedOrgInvitation._meta.label, 0)})
+
+    @staticmethod
+    def _sign_agreement(organization, user, commission):
+        """
+        Update the user's agreement in place, inserting only when none exists
+        yet; a concurrent insert is caught by the (organization, user) unique
+        constraint and retried as an update.
+        """
+        agreements = TutorAgreement.objects.filter(organization=organization, user=user)
+        terms = {'commission_percent': commission, 'signed_by_user': True, 'is_active': True}
+        if agreements.update(updated_at=timezone.now(), **terms):
+            return
+        try:
+            with transaction.atomic():
+                TutorAgreement.objects.create(organization=organization, user=user, **terms)
+        except IntegrityError:
+            agreements.update(updated_at=timezone.now(), **terms)
+
     @action(detail=True, methods=['post'])
+    @transaction.atomic
     def respond(self, request, pk=None):
         invite = self.get_object()
-        serializer = InviteActionSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        data = serializer.validated_data
-        section = data['section']
-        act = data['action']
+        section = request.data.get('section')
+        act = request.data.get('action')
+
+        # Plain accept/reject carries nothing beyond two enum strings; only a
+        # counter (or malformed input) needs the full serializer.
+        if act != 'counter' and section in INVITE_SECTIONS and act in INVITE_ACTIONS:
+            data = {'section': section, 'action': act}
+        else:
+            serializer = InviteActionSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            data = serializer.validated_data
+            section = data['section']
+            act = data['action']
 
         if invite.email != request.user.email:
             return Response({"error": "Not your invitation."}, status=403)
 
-        with transaction.atomic():
-            if section == 'teaching':
-                if not invite.is_tutor_invite:
-                    return Response({"error": "No teaching offer to respond to."}, status=400)
-
-                if act == 'accept':
-                    if invite.tutor_commission < 10:
-                        return Response({"error": "Cannot accept. Commission below 10% limit."}, status=400)
-
-                    invite.tutor_status = 'accepted'
-                    TutorAgreement.objects.update_or_create(
-                        organization=invite.organization,
-                        user=request.user,
-                        defaults={
-                            'commission_percent': invite.tutor_commission,
-                            'signed_by_user': True,
-                            'is_active': True
-                        }
+        changed_fields = []
+        if section == 'teaching':
+            if not invite.is_tutor_invite:
+                return Response({"error": "No teaching offer to respond to."}, status=400)
+
+            if act == 'accept':
+                # Checked here rather than left to TutorAgreement.save(), which
+                # the UPDATE path below does not go through.
+                if invite.tutor_commission < MIN_TUTOR_SHARE_PERCENT:
+                    return Response(
+                        {"error": f"Cannot accept. Commission below {MIN_TUTOR_SHARE_PERCENT:.0f}% limit."},
+                        status=400
                     )
-                elif act == 'reject':
-                    invite.tutor_status = 'rejected'
-                    transaction.on_commit(lambda: notify_rejection(invite, request.user.username, is_invitation=True))
-                elif act == 'counter':
-                    new_val = data['counter_value']
-                    NegotiationLog.objects.create(
-                        invitation=invite, actor=request.user,
-                        action="Countered Teaching Offer",
-                        previous_value=str(invite.tutor_commission),
-                        new_value=str(new_val),
-                        note=data.get('note', '')
-                    )
-                    invite.tutor_commission = new_val
-                    invite.tutor_status = 'negotiating'
-                    transaction.on_commit(lambda: notify_counter_offer(invite, request.user.username))
-
-            elif section == 'governance':
-                if act == 'accept':
-                    invite.gov_status = 'accepted'
-                    OrgMembership.objects.update_or_create(
-                        organization=invite.organization,
-                        user=request.user,
-                        defaults={
-                            'role': invite.gov_role,
-                            'is_active': True
-                        }
-                    )
-                elif act == 'reject':
-                    invite.gov_status = 'rejected'
-                    transaction.on_commit(lambda: notify_rejection(invite, request.user.username, is_invitation=True))
-
-            invite.save()
 
-            if invite.is_fully_resolved and (invite.gov_status == 'accepted' or invite.tutor_status == 'accepted'):
-                transaction.on_commit(lambda: notify_invitation_accepted(invite, request.user.username))
-
-            if invite.is_fully_resolved:
-                OrgJoinRequest.objects.filter(
-                    user=request.user,
+                invite.tutor_status = 'accepted'
+                changed_fields = ['tutor_status']
+                self._sign_agreement(invite.organization, request.user, invite.tutor_commission)
+            elif act == 'reject':
+                invite.tutor_status = 'rejected'
+                changed_fields = ['tutor_status']
+                transaction.on_commit(lambda: notify_invitation_rejected_task.delay(invite.pk, request.user.username))
+            elif act == 'counter':
+                new_val = data['counter_value']
+                NegotiationLog.objects.create(
+                    invitation=invite, actor=request.user,
+                    action="Countered Teaching Offer",
+                    previous_value=str(invite.tutor_commission),
+                    new_value=str(new_val),
+                    note=data.get('note', '')
+                )
+                invite.tutor_commission = new_val
+                invite.tutor_status = 'negotiating'
+                changed_fields = ['tutor_commission', 'tutor_status']
+                transaction.on_commit(lambda: notify_counter_offer_task.delay(invite.pk, request.user.username))
+
+        elif section == 'governance':
+            if act == 'accept':
+                invite.gov_status = 'accepted'
+                changed_fields = ['gov_status']
+                OrgMembership.objects.update_or_create(
                     organization=invite.organization,
-                    status='pending'
-                ).update(status='rejected')
+                    user=request.user,
+                    defaults={
+                        'role': invite.gov_role,
+                        'is_active': True
+                    }
+                )
+            elif act == 'reject':
+                invite.gov_status = 'rejected'
+                changed_fields = ['gov_status']
+                transaction.on_commit(lambda: notify_invitation_rejected_task.delay(invite.pk, request.user.username))
+
+        if changed_fields:
+            invite.save(update_fields=changed_fields + ['updated_at'])
+
+        resolved = invite.is_fully_resolved
+        if resolved and (invite.gov_status == 'accepted' or invite.tutor_status == 'accepted'):
+            transaction.on_commit(lambda: notify_invitation_accepted_task.delay(invite.pk, request.user.username))
+
+        if resolved:
+            OrgJoinRequest.objects.filter(
+                user=request.user,
+                organization=invite.organization,
+                status='pending'
+            ).update(status='rejected', updated_at=timezone.now())
 
         return Response(self.get_serializer(invite).data)
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count, Q
 from django.utils.html import format_html
 from .models import (
     Organization, OrgMembership, OrgCategory,
@@ -6,15 +7,36 @@ from .models import (
 )
 from .models_finance import TutorAgreement, PendingEarning
 
+STATUS_BADGE_HTML = '<span style="color: white; background-color: {}; padding: 3px 10px; border-radius: 12px; font-weight: bold; font-size: 11px;">{}</span>'
+ROLE_BADGE_HTML = '<span style="font-weight: bold; text-transform: uppercase; font-size: 10px;">{}</span>'
+
+STATUS_COLORS = {
+    "draft": "#7f8c8d",
+    "pending_approval": "#f39c12",
+    "approved": "#27ae60",
+    "suspended": "#e74c3c",
+    "archived": "#2c3e50",
+}
+
+# Badges depend only on the choice value, so render each one once.
+STATUS_BADGES = {
+    value: format_html(STATUS_BADGE_HTML, STATUS_COLORS.get(value, "#333"), label)
+    for value, label in Organization.STATUS_CHOICES
+}
+ROLE_BADGES = {value: format_html(ROLE_BADGE_HTML, value) for value, _ in OrgMembership.ROLE_CHOICES}
+
 class OrgMembershipInline(admin.TabularInline):
     model = OrgMembership
     extra = 0
     autocomplete_fields = ('user', 'level')
     fields = ('user', 'role', 'level', 'is_active', 'payment_status')
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user', 'organization', 'level')
+
 @admin.register(Organization)
 class OrganizationAdmin(admin.ModelAdmin):
-    list_display = ('name', 'status_badge', 'org_type', 'membership_info', 'payout_frequency', 'approved')
+    list_display = ('name', 'status_badge', 'org_type', 'membership_info', 'member_count', 'payout_frequency', 'approved')
     list_filter = ('status', 'approved', 'org_type', 'payout_frequency')
     search_fields = ('name', 'slug', 'description')
     prepopulated_fields = {'slug': ('name',)}
@@ -40,34 +62,41 @@ class OrganizationAdmin(admin.ModelAdmin):
     )
 
     def status_badge(self, obj):
-        colors = {
-            "draft": "#7f8c8d",
-            "pending_approval": "#f39c12",
-            "approved": "#27ae60",
-            "suspended": "#e74c3c",
-            "archived": "#2c3e50",
-        }
-        return format_html(
-            '<span style="color: white; background-color: {}; padding: 3px 10px; border-radius: 12px; font-weight: bold; font-size: 11px;">{}</span>',
-            colors.get(obj.status, "#333"), obj.get_status_display()
-        )
+        badge = STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = format_html(STATUS_BADGE_HTML, "#333", obj.get_status_display())
+        return badge
     status_badge.short_description = "Status"
 
     def membership_info(self, obj):
         return f"{obj.membership_price} / {obj.get_membership_period_display()}"
     membership_info.short_description = "Membership"
 
+    def member_count(self, obj):
+        return obj.active_member_count
+    member_count.short_description = "Members"
+    member_count.admin_order_field = "active_member_count"
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            active_member_count=Count('memberships', filter=Q(memberships__is_active=True))
+        )
+
 @admin.register(OrgMembership)
 class OrgMembershipAdmin(admin.ModelAdmin):
     list_display = ('user', 'organization', 'role_badge', 'level', 'is_active', 'payment_status', 'date_joined')
-    list_filter = ('role', 'is_active', 'payment_status', 'organization', 'level')
+    list_filter = (
+        'role', 'is_active', 'payment_status',
+        ('organization', admin.RelatedOnlyFieldListFilter),
+        ('level', admin.RelatedOnlyFieldListFilter),
+    )
     search_fields = ('user__username', 'user__email', 'organization__name')
     autocomplete_fields = ('user', 'organization', 'level', 'subjects')
     filter_horizontal = ('subjects',)
     readonly_fields = ('date_joined',)
 
     def role_badge(self, obj):
-        return format_html('<span style="font-weight: bold; text-transform: uppercase; font-size: 10px;">{}</span>', obj.role)
+        return ROLE_BADGES.get(obj.role) or format_html(ROLE_BADGE_HTML, obj.role)
     role_badge.short_description = "Role"
 
     def get_queryset(self, request):
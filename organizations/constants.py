@@ -2,4 +2,10 @@ from decimal import Decimal
 
 MIN_TUTOR_SHARE_PERCENT = Decimal('40.00')
 MAX_ORG_SHARE_PERCENT = Decimal('60.00')
-DEFAULT_PAYOUT_DAY = 1
\ No newline at end of file
+DEFAULT_PAYOUT_DAY = 1
+
+# Length of one membership period; lifetime/free memberships never expire.
+MEMBERSHIP_PERIOD_DAYS = {'monthly': 30, 'yearly': 365}
+
+ACTIVE_ORG_CACHE_TTL = 60 * 5
+ORG_STATS_CACHE_TTL = 60
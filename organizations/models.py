@@ -1,10 +1,11 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.utils.text import slugify
 from django.core.validators import MinValueValidator, MaxValueValidator
 from datetime import timedelta
-from .constants import DEFAULT_PAYOUT_DAY
+from .constants import DEFAULT_PAYOUT_DAY, MEMBERSHIP_PERIOD_DAYS
 
 class Organization(models.Model):
     ORG_TYPES = [
@@ -62,32 +63,84 @@ class Organization(models.Model):
     )
     auto_distribute = models.BooleanField(default=True)
 
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True, blank=True,
+        on_delete=models.SET_NULL,
+        related_name="owned_organizations",
+        help_text="Denormalized from the owner membership."
+    )
+
     approved = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            # Discovery lists approved orgs in the default name order.
+            models.Index(
+                fields=['name'],
+                condition=models.Q(approved=True),
+                name='org_approved_name_idx'
+            ),
+            models.Index(
+                fields=['org_type', 'name'],
+                condition=models.Q(approved=True),
+                name='org_approved_type_name_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def slug_cache_key(slug):
+        return f"org:slug:{slug}"
+
+    @staticmethod
+    def stats_cache_key(org_id):
+        return f"org:stats:{org_id}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets the post_save receiver drop the cache entry of a slug that was
+        # renamed away.
+        instance._loaded_slug = instance.__dict__.get('slug')
+        return instance
+
+    def _generate_slug(self):
+        base_slug = slugify(self.name)
+        taken = set(Organization.objects.filter(slug__startswith=base_slug).values_list('slug', flat=True))
+        slug = base_slug
+        counter = 1
+        while slug in taken:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        return slug
+
     def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.name)
-            slug = base_slug
-            counter = 1
-            while Organization.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
+        generated_slug = not self.slug
+        if generated_slug:
+            self.slug = self._generate_slug()
 
         if self.status == 'approved':
             self.approved = True
         else:
             self.approved = False
 
-        super().save(*args, **kwargs)
+        if generated_slug:
+            # Another save may claim the same slug between the lookup and the
+            # insert; pick the next free one and try once more.
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+            except IntegrityError:
+                self.slug = self._generate_slug()
+                super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
 
 
 class OrgMembership(models.Model):
@@ -137,6 +190,9 @@ class OrgMembership(models.Model):
 
     class Meta:
         unique_together = ("user", "organization")
+        indexes = [
+            models.Index(fields=['organization', 'role', 'is_active']),
+        ]
 
     def is_admin_or_owner(self):
         return self.role in ["admin", "owner"]
@@ -146,12 +202,9 @@ class OrgMembership(models.Model):
 
     def activate_membership(self):
         org = self.organization
-        if org.membership_period == "lifetime":
-            self.expires_at = None
-        elif org.membership_period == "monthly":
-            self.expires_at = timezone.now() + timedelta(days=30 * (org.membership_duration_value or 1))
-        elif org.membership_period == "yearly":
-            self.expires_at = timezone.now() + timedelta(days=365 * (org.membership_duration_value or 1))
+        period_days = MEMBERSHIP_PERIOD_DAYS.get(org.membership_period)
+        if period_days:
+            self.expires_at = timezone.now() + timedelta(days=period_days * (org.membership_duration_value or 1))
         else:
             self.expires_at = None
 
@@ -174,12 +227,11 @@ class OrgMembership(models.Model):
         if self.level:
             course_qs = course_qs.filter(org_level=self.level)
 
-        for course in course_qs:
-            Enrollment.objects.get_or_create(
-                user=self.user,
-                course=course,
-                defaults={'role': 'student', 'status': 'active'}
-            )
+        enrolled = Enrollment.objects.filter(user=self.user, course__in=course_qs).values_list('course_id', flat=True)
+        Enrollment.objects.bulk_create([
+            Enrollment(user=self.user, course_id=course_id, role='student', status='active')
+            for course_id in course_qs.exclude(pk__in=enrolled).values_list('id', flat=True)
+        ], ignore_conflicts=True, batch_size=1000)
 
         now = timezone.now()
         event_qs = Event.objects.filter(
@@ -188,26 +240,66 @@ class OrgMembership(models.Model):
             start_time__gte=now
         )
 
-        for event in event_qs:
-            EventRegistration.objects.get_or_create(
+        # Registrations go through save() one by one: it issues the QR ticket
+        # and confirmation email, which bulk_create would skip.
+        registered = EventRegistration.objects.filter(user=self.user).values_list('event_id', flat=True)
+        for event in event_qs.exclude(pk__in=registered):
+            EventRegistration.objects.create(
                 event=event,
                 user=self.user,
-                defaults={'status': 'registered', 'payment_status': 'free'}
+                status='registered',
+                payment_status='free'
             )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so save() can spot activation and owner changes without
+        # re-reading the row; None when the field was deferred.
+        instance._loaded_is_active = instance.__dict__.get('is_active')
+        instance._loaded_role = instance.__dict__.get('role')
+        return instance
+
+    @staticmethod
+    def sync_org_owner(organization_id, user_id, is_owner):
+        """
+        Point Organization.owner at user_id, or clear it if it still points
+        there, and drop the org's cached slug lookup when the row changed.
+        """
+        orgs = Organization.objects.filter(pk=organization_id)
+        if is_owner:
+            updated = orgs.exclude(owner_id=user_id).update(owner_id=user_id)
+        else:
+            updated = orgs.filter(owner_id=user_id).update(owner=None)
+        if updated:
+            slug = orgs.values_list('slug', flat=True).first()
+            cache.delete(Organization.slug_cache_key(slug))
+
     def save(self, *args, **kwargs):
         is_new = self.pk is None
         is_activating = False
+        was_role = None
 
         if not is_new:
-            old_instance = OrgMembership.objects.get(pk=self.pk)
-            if not old_instance.is_active and self.is_active:
+            was_active = getattr(self, '_loaded_is_active', None)
+            was_role = getattr(self, '_loaded_role', None)
+            if was_active is None or was_role is None:
+                was_active, was_role = OrgMembership.objects.filter(pk=self.pk).values_list(
+                    'is_active', 'role'
+                ).first() or (None, None)
+            if was_active is False and self.is_active:
                 is_activating = True
 
         super().save(*args, **kwargs)
+        self._loaded_is_active = self.is_active
+        self._loaded_role = self.role
+
+        if (self.role == 'owner') != (was_role == 'owner'):
+            self.sync_org_owner(self.organization_id, self.user_id, self.role == 'owner')
 
         if (is_new or is_activating) and self.role == 'student' and self.is_active:
-            self.sync_access()
+            from .tasks import sync_membership_access_task
+            transaction.on_commit(lambda: sync_membership_access_task.delay(self.pk))
 
         if (is_new or is_activating) and self.is_active:
             from .utils import send_membership_welcome_email
@@ -1,7 +1,25 @@
+from django.core.cache import cache
 from rest_framework import permissions
+from .constants import ACTIVE_ORG_CACHE_TTL
 from .models import Organization, OrgMembership
 
 
+def get_org_by_slug(slug):
+    """
+    Organization for slug, cached across requests; the Organization
+    post_save/post_delete receivers drop the entry.
+    """
+    key = Organization.slug_cache_key(slug)
+    org = cache.get(key)
+    if org is None:
+        try:
+            org = Organization.objects.get(slug=slug)
+        except Organization.DoesNotExist:
+            return None
+        cache.set(key, org, ACTIVE_ORG_CACHE_TTL)
+    return org
+
+
 def get_active_org(request):
     if hasattr(request, "active_organization") and request.active_organization:
         return request.active_organization
@@ -10,12 +28,26 @@ def get_active_org(request):
     if not slug:
         return None
 
-    try:
-        org = Organization.objects.get(slug=slug)
+    org = get_org_by_slug(slug)
+    if org is not None:
         request.active_organization = org
-        return org
-    except Organization.DoesNotExist:
-        return None
+    return org
+
+
+def get_org_membership(request, org):
+    """
+    request.user's membership in org, fetched once per request and shared by
+    the middleware, permission classes and views that check it.
+    """
+    memberships = getattr(request, "_org_membership_cache", None)
+    if memberships is None:
+        memberships = request._org_membership_cache = {}
+    # Keyed by user too: DRF may authenticate a different user than the
+    # session user the middleware saw on the same request.
+    key = (request.user.pk, org.pk)
+    if key not in memberships:
+        memberships[key] = OrgMembership.objects.filter(user=request.user, organization=org).first()
+    return memberships[key]
 
 
 class IsOrgMember(permissions.BasePermission):
@@ -25,7 +57,8 @@ class IsOrgMember(permissions.BasePermission):
         org = get_active_org(request)
         if not org:
             return False
-        return OrgMembership.objects.filter(user=request.user, organization=org, is_active=True).exists()
+        membership = get_org_membership(request, org)
+        return membership is not None and membership.is_active
 
 
 class IsOrgAdminOrOwner(permissions.BasePermission):
@@ -34,26 +67,18 @@ class IsOrgAdminOrOwner(permissions.BasePermission):
             return False
 
         slug = view.kwargs.get('slug')
-        if slug:
-            return OrgMembership.objects.filter(
-                user=request.user,
-                organization__slug=slug,
-                role__in=['admin', 'owner']
-            ).exists()
-
-        org = get_active_org(request)
+        org = get_org_by_slug(slug) if slug else get_active_org(request)
         if not org:
             return False
-        return OrgMembership.objects.filter(
-            user=request.user, organization=org, role__in=['admin', 'owner']
-        ).exists()
+        membership = get_org_membership(request, org)
+        return membership is not None and membership.role in ['admin', 'owner']
 
     def has_object_permission(self, request, view, obj):
         if not request.user.is_authenticated:
             return False
 
         if isinstance(obj, Organization):
-            membership = OrgMembership.objects.filter(user=request.user, organization=obj).first()
+            membership = get_org_membership(request, obj)
             if not membership:
                 return False
 
@@ -77,8 +102,8 @@ class IsOrgStaff(permissions.BasePermission):
         org = get_active_org(request)
         if not org:
             return False
-        membership = OrgMembership.objects.filter(user=request.user, organization=org, is_active=True).first()
-        if not membership:
+        membership = get_org_membership(request, org)
+        if not membership or not membership.is_active:
             return False
         if membership.role == 'student':
             return False
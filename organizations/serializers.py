@@ -7,8 +7,10 @@ from org_community.models import OrgJoinRequest, AdvancedOrgInvitation
 from users.models import CreatorProfile
 from .models import Organization, OrgMembership, GuardianLink, OrgLevel, OrgCategory
 from .models_finance import TutorAgreement
-from .constants import MIN_TUTOR_SHARE_PERCENT
+from .constants import MIN_TUTOR_SHARE_PERCENT, ORG_STATS_CACHE_TTL
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Count, Q
 
 User = get_user_model()
 
@@ -125,13 +127,17 @@ class OrganizationDetailSerializer(serializers.ModelSerializer):
         return None
 
     def get_stats(self, obj):
-        return {
-            "students": OrgMembership.objects.filter(organization=obj, role="student", is_active=True).count(),
-            "tutors": OrgMembership.objects.filter(organization=obj, role__in=["tutor", "admin", "owner"],
-                                                   is_active=True).count(),
-            "courses": Course.objects.filter(organization=obj, status='published').count(),
-            "upcoming_events": 0
-        }
+        key = Organization.stats_cache_key(obj.pk)
+        stats = cache.get(key)
+        if stats is None:
+            stats = OrgMembership.objects.filter(organization=obj, is_active=True).aggregate(
+                students=Count('id', filter=Q(role="student")),
+                tutors=Count('id', filter=Q(role__in=["tutor", "admin", "owner"])),
+            )
+            stats["courses"] = Course.objects.filter(organization=obj, status='published').count()
+            stats["upcoming_events"] = 0
+            cache.set(key, stats, ORG_STATS_CACHE_TTL)
+        return stats
 
     def get_current_user_membership(self, obj):
         request = self.context.get('request')
@@ -233,8 +239,9 @@ class OrganizationCreateSerializer(serializers.ModelSerializer):
         levels_data = validated_data.pop('levels', [])
         categories_data = validated_data.pop('categories', [])
         founder_comm = validated_data.pop('founder_commission_percent')
+        user = self.context['request'].user
 
-        organization = Organization.objects.create(**validated_data)
+        organization = Organization.objects.create(owner=user, **validated_data)
 
         if levels_data:
             OrgLevel.objects.bulk_create(
@@ -246,7 +253,6 @@ class OrganizationCreateSerializer(serializers.ModelSerializer):
                 [OrgCategory(organization=organization, **item) for item in categories_data]
             )
 
-        user = self.context['request'].user
         OrgMembership.objects.create(
             user=user, organization=organization, role='owner',
             is_active=True, payment_status='paid'
@@ -310,6 +316,11 @@ class OrganizationListSerializer(serializers.ModelSerializer):
     is_member = serializers.SerializerMethodField()
     logo = serializers.SerializerMethodField()
 
+    # Organization columns read by to_representation; the list queryset
+    # loads only these.
+    model_columns = ('id', 'slug', 'name', 'org_type', 'logo', 'description', 'membership_price',
+                     'membership_period', 'status')
+
     class Meta:
         model = Organization
         fields = ('slug', 'name', 'org_type', 'logo', 'description', 'membership_price', 'membership_period',
@@ -324,6 +335,10 @@ class OrganizationListSerializer(serializers.ModelSerializer):
         return None
 
     def get_is_member(self, obj):
+        member_org_ids = self.context.get('member_org_ids')
+        if member_org_ids is not None:
+            return obj.id in member_org_ids
+
         user = self.context.get('request').user
         if not user or not user.is_authenticated:
             return False
@@ -0,0 +1,30 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Organization, OrgMembership
+
+
+@receiver(post_save, sender=OrgMembership)
+@receiver(post_delete, sender=OrgMembership)
+@receiver(post_save, sender="courses.Course")
+@receiver(post_delete, sender="courses.Course")
+def invalidate_org_stats(sender, instance, **kwargs):
+    """Member and published course counts on the organization detail page."""
+    if instance.organization_id:
+        cache.delete(Organization.stats_cache_key(instance.organization_id))
+
+
+@receiver(post_delete, sender=OrgMembership)
+def clear_org_owner(sender, instance, **kwargs):
+    """Organization.owner must not outlive the owner membership."""
+    if instance.role == 'owner':
+        OrgMembership.sync_org_owner(instance.organization_id, instance.user_id, False)
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def invalidate_org_slug(sender, instance, **kwargs):
+    """Cached slug lookups, including the old slug after a rename."""
+    stale_slugs = {instance.slug, getattr(instance, '_loaded_slug', None)} - {None}
+    cache.delete_many([Organization.slug_cache_key(slug) for slug in stale_slugs])
+    instance._loaded_slug = instance.slug
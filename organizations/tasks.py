@@ -0,0 +1,38 @@
+from celery import shared_task
+from .models import OrgMembership
+from .utils import send_membership_welcome_email
+
+
+@shared_task(bind=True, max_retries=3)
+def sync_membership_access_task(self, membership_id):
+    """
+    Background task to enroll a student member in the organization's
+    published courses and upcoming events. Safe to retry: sync_access
+    only creates what is missing.
+    """
+    try:
+        membership = OrgMembership.objects.select_related(
+            "user", "organization", "level"
+        ).get(pk=membership_id)
+        membership.sync_access()
+    except OrgMembership.DoesNotExist:
+        return
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=60)
+
+
+@shared_task(bind=True, max_retries=3)
+def send_membership_welcome_task(self, membership_id):
+    """
+    Background task to send the welcome email for a membership created
+    outside OrgMembership.save() (e.g. bulk approval).
+    """
+    try:
+        membership = OrgMembership.objects.select_related(
+            "user", "organization"
+        ).get(pk=membership_id)
+        send_membership_welcome_email(membership)
+    except OrgMembership.DoesNotExist:
+        return
+    except Exception as exc:
+        raise self.retry(exc=exc, countdown=60)
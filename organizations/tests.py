@@ -0,0 +1,67 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from revenue.models import Wallet
+
+from .models import Organization, OrgMembership
+from .permissions import get_org_by_slug
+
+User = get_user_model()
+
+
+class OrgSlugCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.org = Organization.objects.create(name="Acme", status="approved")
+
+    def test_queryset_delete_drops_cached_slug(self):
+        self.assertEqual(get_org_by_slug(self.org.slug), self.org)
+
+        Wallet.objects.filter(owner_org=self.org).delete()
+        Organization.objects.filter(pk=self.org.pk).delete()
+
+        self.assertIsNone(cache.get(Organization.slug_cache_key(self.org.slug)))
+        self.assertIsNone(get_org_by_slug(self.org.slug))
+
+    def test_rename_drops_old_slug(self):
+        org = Organization.objects.get(pk=self.org.pk)
+        old_slug = org.slug
+        get_org_by_slug(old_slug)
+
+        org.slug = "acme-renamed"
+        org.save()
+
+        self.assertIsNone(cache.get(Organization.slug_cache_key(old_slug)))
+
+
+class OrgOwnerSyncTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="owner", email="owner@example.com", password="x")
+        self.org = Organization.objects.create(name="Acme", status="approved")
+        self.membership = OrgMembership.objects.create(user=self.user, organization=self.org, role="owner")
+
+    def _owner_id(self):
+        return Organization.objects.values_list("owner_id", flat=True).get(pk=self.org.pk)
+
+    def test_owner_membership_sets_owner(self):
+        self.assertEqual(self._owner_id(), self.user.pk)
+
+    def test_demotion_clears_owner(self):
+        membership = OrgMembership.objects.get(pk=self.membership.pk)
+        membership.role = "admin"
+        membership.save()
+
+        self.assertIsNone(self._owner_id())
+
+    def test_delete_clears_owner(self):
+        self.membership.delete()
+
+        self.assertIsNone(self._owner_id())
+
+    def test_save_without_role_change_leaves_organization_alone(self):
+        membership = OrgMembership.objects.get(pk=self.membership.pk)
+        membership.is_active = True
+        # The membership UPDATE alone; no Organization query.
+        with self.assertNumQueries(1):
+            membership.save(update_fields=["is_active"])
@@ -12,13 +12,14 @@ from django.contrib.auth import get_user_model
 from rest_framework.generics import CreateAPIView
 
 from DVuka_Backend import settings
+from org_community.utils import get_user_org_state
 from orders.models import Order, OrderItem
 from payments.models import Payment
 from payments.services.paystack import initialize_transaction
 
 from .models import Organization, OrgMembership, GuardianLink, OrgCategory, OrgLevel
 from .filters import OrganizationFilter
-from .permissions import IsOrgMember, IsOrgAdminOrOwner, get_active_org
+from .permissions import IsOrgMember, IsOrgAdminOrOwner, get_active_org, get_org_membership
 
 from .serializers import (
     OrganizationSerializer, OrgMembershipSerializer, GuardianLinkSerializer,
@@ -49,6 +50,8 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         if self.request.user.is_authenticated:
             my_orgs = Organization.objects.filter(memberships__user=self.request.user)
             queryset = (queryset | my_orgs).distinct()
+        if self.action == 'list':
+            queryset = queryset.only(*OrganizationListSerializer.model_columns)
         return queryset
 
     def get_permissions(self):
@@ -62,6 +65,12 @@ class OrganizationViewSet(viewsets.ModelViewSet):
             return [permissions.AllowAny()]
         return [permissions.IsAuthenticated()]
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action == 'list' and self.request.user.is_authenticated:
+            context['member_org_ids'] = get_user_org_state(self.request.user)['member_org_ids']
+        return context
+
     def get_serializer_class(self):
         if self.action == 'create':
             return OrganizationCreateSerializer
@@ -262,13 +271,8 @@ class GuardianLinkViewSet(viewsets.ModelViewSet):
         queryset = GuardianLink.objects.filter(Q(parent=user) | Q(student=user))
         active_org = get_active_org(self.request)
         if active_org:
-            is_admin = OrgMembership.objects.filter(
-                user=user,
-                organization=active_org,
-                role__in=['admin', 'owner'],
-                is_active=True
-            ).exists()
-            if is_admin:
+            membership = get_org_membership(self.request, active_org)
+            if membership and membership.is_active and membership.role in ['admin', 'owner']:
                 org_links = GuardianLink.objects.filter(organization=active_org)
                 queryset = (queryset | org_links).distinct()
         return queryset
@@ -292,7 +296,7 @@ class OrgTeamViewSet(viewsets.ModelViewSet):
         return OrgMembership.objects.filter(
             organization=active_org,
             role__in=allowed_roles
-        ).select_related('user')
+        ).select_related('user', 'organization')
 
 
 class ActiveOrganizationView(generics.RetrieveUpdateAPIView):
@@ -1,5 +1,5 @@
 from rest_framework import permissions
-from organizations.models import OrgMembership
+from organizations.permissions import get_org_membership
 
 
 class IsTutorOrOrgAdmin(permissions.BasePermission):
@@ -15,9 +15,7 @@ class IsTutorOrOrgAdmin(permissions.BasePermission):
             return False
 
         if active_org:
-            membership = OrgMembership.objects.filter(
-                user=user, organization=active_org
-            ).first()
+            membership = get_org_membership(request, active_org)
             return membership and membership.role in ["admin", "owner", "tutor"]
 
         return True
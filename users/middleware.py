@@ -1,4 +1,4 @@
-from organizations.models import Organization
+from organizations.permissions import get_org_by_slug, get_org_membership
 
 
 class ActiveOrganizationMiddleware:
@@ -13,21 +13,17 @@ class ActiveOrganizationMiddleware:
         slug = request.headers.get('X-Organization-Slug')
 
         if slug and request.user.is_authenticated:
-            try:
-                # 3. Security Check: Find the org IF the user is a member
-                organization = Organization.objects.get(
-                    slug=slug,
-                    memberships__user=request.user,
-                    memberships__is_active=True
-                )
+            # 3. Security Check: Find the org IF the user is a member.
+            # Both lookups are cached, and the membership is reused by the
+            # org permission classes later in the request.
+            organization = get_org_by_slug(slug)
+            membership = get_org_membership(request, organization) if organization else None
 
+            if membership and membership.is_active:
                 # 4. Success: Attach the org to the request
                 request.active_organization = organization
-
-            except Organization.DoesNotExist:
-                # Failure: User is not a member or org doesn't exist.
-                # request.active_organization stays None.
-                pass
+            # Failure: User is not a member or org doesn't exist.
+            # request.active_organization stays None.
 
         response = self.get_response(request)
         return response
\ No newline at end of file